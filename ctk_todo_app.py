@@ -2,15 +2,75 @@
 
 import tkinter
 import customtkinter as ctk
+import gc
 import json
+import mmap
 import os
+import time
+import uuid
 from datetime import datetime
+from functools import partial
+
+# Optional fast JSON backend. Prefer orjson (~10x stdlib for dumps), then
+# ujson (~3x stdlib), then fall back to the stdlib. _dumps always returns
+# bytes so callers can write in binary mode regardless of backend.
+# The file is machine-consumed, so emit compact JSON: indentation forces the
+# stdlib down its pure-Python iterencode path and inflates the file ~3x.
+try:
+    import orjson as _j
+
+    def _dumps(obj):
+        return _j.dumps(obj, option=_j.OPT_APPEND_NEWLINE)
+
+    def _loads(data):
+        # orjson takes memoryview, so mmap input stays zero-copy.
+        if isinstance(data, (str, bytes)):
+            return _j.loads(data)
+        return _j.loads(memoryview(data))
+except ImportError:
+    try:
+        import ujson as _j
+
+        def _dumps(obj):
+            return _j.dumps(obj).encode()
+
+        def _loads(data):
+            if isinstance(data, (str, bytes, bytearray)):
+                return _j.loads(data)
+            return _j.loads(bytes(data))
+    except ImportError:
+        def _dumps(obj):
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+        def _loads(data):
+            if isinstance(data, (str, bytes, bytearray)):
+                return json.loads(data)
+            return json.loads(bytes(data))
+
+# Optional SIMD parser for large task files. pysimdjson returns lazy
+# proxies over its parse tape, so each task only pays materialisation cost
+# when it is converted to a native dict.
+try:
+    import simdjson as _simdjson
+except ImportError:
+    _simdjson = None
+
+# Optional msgpack delta log. When available, per-edit saves append one
+# tiny packed record instead of rewriting the whole JSON file; the JSON
+# snapshot is only written on exit (or by the debounced fallback).
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # --- Constants ---
 TASKS_FILE = "tasks_gui.json" # Will be created in the same directory as the script
+TASKS_LOG_FILE = "tasks_gui.msgpack" # Session delta log replayed over the snapshot
 APP_NAME = "My To-Do List"
 WINDOW_WIDTH = 550
 WINDOW_HEIGHT = 600
+TASK_ROW_HEIGHT = 64   # reserved height per task row (for scrollbar geometry)
+VISIBLE_ROW_BUFFER = 3 # extra rows materialised above/below the viewport
 
 # --- Appearance Settings (Modify as desired) ---
 # Modes: "System" (default), "Dark", "Light"
@@ -21,53 +81,164 @@ ctk.set_default_color_theme("blue")
 # --- Core Functions ---
 
 def load_tasks(filename=TASKS_FILE):
-    """Loads tasks from a JSON file."""
-    if not os.path.exists(filename):
-        return []
-    # Check if file is empty
-    if os.path.getsize(filename) == 0:
-        print(f"Warning: '{filename}' is empty. Starting fresh.")
-        return []
+    """Loads tasks from a JSON file.
+
+    Returns four parallel column lists (id, description, done, timestamp) so
+    that sorting and filtering touch only the columns they need instead of
+    dereferencing a dict per task.
+    """
+    # One stat covers both the existence and the empty-file check.
     try:
-        with open(filename, 'r') as f:
-            tasks = json.load(f)
-            if not isinstance(tasks, list):
-                print(f"Warning: '{filename}' format incorrect. Starting fresh.")
-                return []
-            # Ensure essential keys exist (add defaults if missing)
-            for task in tasks:
-                task.setdefault('description', 'No Description')
-                task.setdefault('done', False)
-                # Add timestamp if missing from older format, handle potential errors
-                if 'timestamp' not in task:
-                     # Provide a default past timestamp or handle as needed
-                     task['timestamp'] = datetime(1970, 1, 1).strftime("%Y-%m-%d %H:%M:%S")
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return [], [], [], []
+    if st.st_size == 0:
+        return [], [], [], []
+    try:
+        # Memory-map the file instead of reading it into a fresh bytes
+        # object; both parsers accept buffer-protocol inputs, so they parse
+        # straight over the kernel's page cache with no extra copy.
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Every dict/list the parser allocates bumps the gen-0 counter,
+            # so a large file triggers collections mid-parse; nothing cyclic
+            # is created here, so pause the GC for the duration of the parse.
+            gc.disable()
+            try:
+                if _simdjson is not None:
+                    # Tasks get mutated during normalisation below, so each
+                    # lazy proxy is converted to a native dict exactly once
+                    # here, while the mapping is still open.
+                    parsed = _simdjson.Parser().parse(mm)
+                    if not isinstance(parsed, _simdjson.Array):
+                        print(f"Warning: '{filename}' format incorrect. Starting fresh.")
+                        return [], [], [], []
+                    tasks = [task.as_dict() for task in parsed]
                 else:
-                    # Basic validation/correction of timestamp format if needed (optional)
-                    try:
-                        datetime.strptime(task['timestamp'], "%Y-%m-%d %H:%M:%S")
-                    except ValueError:
-                         print(f"Warning: Correcting invalid timestamp format for task: {task.get('description')}")
-                         task['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S") # Or a default
-
-            return tasks
-    except (json.JSONDecodeError, IOError) as e:
+                    tasks = _loads(mm)
+                    if not isinstance(tasks, list):
+                        print(f"Warning: '{filename}' format incorrect. Starting fresh.")
+                        return [], [], [], []
+            finally:
+                gc.enable()
+        finally:
+            mm.close()
+        # Normalise each on-disk dict once and split it into the columns.
+        ids, descriptions, dones, timestamps = [], [], [], []
+        for task in tasks:
+            # Stable id for O(1) lookup; assign one for tasks saved before
+            # ids existed.
+            ids.append(task.get('id') or uuid.uuid4().hex)
+            descriptions.append(task.get('description', 'No Description'))
+            dones.append(bool(task.get('done', False)))
+            # Timestamps are stored as integer epoch seconds; migrate legacy
+            # "YYYY-MM-DD HH:MM:SS" strings once here so the hot paths never
+            # touch strptime/strftime again.
+            timestamp = task.get('timestamp', 0)
+            if not isinstance(timestamp, (int, float)):
+                try:
+                    timestamp = int(
+                        datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").timestamp()
+                    )
+                except (TypeError, ValueError):
+                    print(f"Warning: Correcting invalid timestamp for task: {task.get('description')}")
+                    timestamp = int(time.time())
+            timestamps.append(timestamp)
+
+        return ids, descriptions, dones, timestamps
+    except (ValueError, IOError) as e:
+        # ValueError covers json.JSONDecodeError and orjson.JSONDecodeError alike.
         print(f"Error loading tasks from '{filename}': {e}. Starting fresh.")
-        return []
+        return [], [], [], []
     except Exception as e: # Catch other potential errors during loading/processing
         print(f"An unexpected error occurred loading tasks: {e}. Starting fresh.")
-        return []
+        return [], [], [], []
 
 
 def save_tasks(tasks, filename=TASKS_FILE):
-    """Saves the current list of tasks to a JSON file."""
+    """Saves the current list of tasks to a JSON file.
+
+    Returns True when the snapshot reached disk, so callers know whether
+    the delta log can safely be dropped.
+    """
     try:
-        with open(filename, 'w') as f:
-            json.dump(tasks, f, indent=4)
+        # Write to a sidecar and rename over the target so a crash mid-write
+        # can never leave a truncated or empty tasks file behind.
+        payload = _dumps(tasks)
+        tmp_name = filename + '.tmp'
+        with open(tmp_name, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, filename)
+        return True
     except IOError as e:
         print(f"Error saving tasks to '{filename}': {e}")
     except Exception as e:
         print(f"An unexpected error occurred saving tasks: {e}")
+    return False
+
+
+def replay_op_log(ids, descriptions, dones, timestamps, filename=TASKS_LOG_FILE):
+    """Replays the msgpack delta log over the snapshot columns in place.
+
+    The log only exists if the previous session did not exit cleanly; a
+    clean exit consolidates everything into the JSON snapshot and removes it.
+    """
+    if msgpack is None:
+        return
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return
+    if st.st_size == 0:
+        return
+    try:
+        with open(filename, 'rb') as f:
+            for op in msgpack.Unpacker(f, raw=False):
+                kind = op.get('op')
+                if kind == 'add':
+                    # Extract every field before touching any column so a
+                    # malformed record is skipped whole instead of leaving
+                    # the parallel lists at different lengths.
+                    try:
+                        task = op['task']
+                        tid = task['id']
+                        description = task['description']
+                        done = task['done']
+                        timestamp = task['timestamp']
+                    except (KeyError, TypeError):
+                        print(f"Warning: skipping malformed record in '{filename}'.")
+                        continue
+                    # The id already being present means this op was
+                    # consolidated by a snapshot that did not get to drop
+                    # the log; replaying it again would duplicate the task.
+                    if tid in ids:
+                        continue
+                    ids.append(tid)
+                    descriptions.append(description)
+                    dones.append(done)
+                    timestamps.append(timestamp)
+                    continue
+                tid = op.get('id')
+                if tid is None:
+                    print(f"Warning: skipping malformed record in '{filename}'.")
+                    continue
+                try:
+                    col = ids.index(tid)
+                except ValueError:
+                    continue
+                if kind == 'toggle':
+                    # Absolute state, so replaying over an already-updated
+                    # snapshot is a no-op rather than a flip back.
+                    if 'done' in op:
+                        dones[col] = bool(op['done'])
+                elif kind == 'del':
+                    for column in (ids, descriptions, dones, timestamps):
+                        column.pop(col)
+    except Exception as e:
+        print(f"Warning: could not replay '{filename}': {e}. Using snapshot only.")
 
 
 # --- Main Application Class ---
@@ -76,7 +247,28 @@ class TodoApp(ctk.CTk):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.tasks = load_tasks()
+        # Tasks live in Struct-of-Arrays form: four parallel columns kept in
+        # insertion order, with _task_pos mapping id -> column index. Sorting
+        # for display touches only the done/timestamp columns.
+        self._task_ids, self._task_descs, self._task_dones, self._task_times = load_tasks()
+        replay_op_log(self._task_ids, self._task_descs, self._task_dones, self._task_times)
+        self._task_pos = {tid: i for i, tid in enumerate(self._task_ids)}
+        self._save_job = None  # pending debounced-save timer id, if any
+        self._op_log = None  # msgpack delta-log handle, opened on first edit
+        self._row_widgets = {}  # task id -> cached row widgets, see refresh_task_list
+        self._no_task_label = None
+        self._reserved_rows = 0  # grid rows currently holding a minsize
+        self._viewport_job = None  # pending after_idle viewport refresh
+
+        # Fonts and theme colors shared by every row. CTkFont construction
+        # and ThemeManager dict walks are costly enough to hoist out of the
+        # per-row loop.
+        self._font_done = ctk.CTkFont(slant="italic", overstrike=True)
+        self._font_open = ctk.CTkFont(slant="roman", overstrike=False)
+        self._font_timestamp = ctk.CTkFont(size=9)
+        self._default_label_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+        self._default_btn_fg = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+        self._default_btn_hover = ctk.ThemeManager.theme["CTkButton"]["hover_color"]
 
         # --- Window Setup ---
         self.title(APP_NAME)
@@ -112,6 +304,15 @@ class TodoApp(ctk.CTk):
         self.task_list_frame.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="nsew")
         self.task_list_frame.grid_columnconfigure(0, weight=1) # Allow task content to expand
 
+        # Only rows intersecting the viewport are materialised; rebuild the
+        # window whenever the view changes. Tk invokes yscrollcommand on
+        # every view change regardless of input source (wheel, scrollbar
+        # drag, keyboard), so hook it rather than per-widget scroll events,
+        # which only fire on the widget under the pointer.
+        canvas = self.task_list_frame._parent_canvas
+        canvas.configure(yscrollcommand=self._on_task_list_scroll)
+        canvas.bind("<Configure>", self._on_viewport_change, add="+")
+
         # --- Initial Task Display ---
         self.refresh_task_list()
 
@@ -127,103 +328,227 @@ class TodoApp(ctk.CTk):
         frame.grid_columnconfigure(1, weight=1) # Allow label to expand
         return frame
 
-    def refresh_task_list(self):
-        """Clears and redraws the tasks in the scrollable frame."""
-        # Clear existing task widgets
-        for widget in self.task_list_frame.winfo_children():
-            widget.destroy()
-
-        # Sort tasks: incomplete first, then by timestamp (newest first is tricky with strptime, let's do oldest first)
+    def _schedule_save(self):
+        """Coalesces rapid mutations into a single save 500 ms after the last one."""
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(500, self._do_save)
+
+    def _do_save(self):
+        """Runs the debounced save and clears the pending timer."""
+        self._save_job = None
+        # A successful snapshot subsumes every logged delta; dropping the
+        # log here keeps the two from ever being applied on top of each
+        # other at the next startup.
+        if save_tasks(self._tasks_as_dicts()):
+            self._clear_op_log()
+
+    def _clear_op_log(self):
+        """Drops the delta log once a full snapshot holds its contents."""
+        if self._op_log is not None:
+            self._op_log.close()
+            self._op_log = None
         try:
-            sorted_tasks = sorted(
-                self.tasks,
-                key=lambda t: datetime.strptime(t.get('timestamp', '1970-01-01 00:00:00'), "%Y-%m-%d %H:%M:%S")
-            )
-            # Then sort by completion status (incomplete first)
-            sorted_tasks = sorted(sorted_tasks, key=lambda t: t.get('done', False))
-        except ValueError as e:
-             print(f"Error sorting tasks by timestamp: {e}. Displaying unsorted.")
-             # Fallback: Sort only by completion status if timestamps are bad
-             sorted_tasks = sorted(self.tasks, key=lambda t: t.get('done', False))
-
-
-        if not sorted_tasks:
-             no_task_label = ctk.CTkLabel(self.task_list_frame, text="No tasks yet!", text_color="gray")
-             no_task_label.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
-             return
-
-        # Add tasks to the frame
-        for index, task in enumerate(sorted_tasks):
-            task_frame = self.create_gradient_frame(self.task_list_frame)
-            task_frame.grid(row=index, column=0, padx=5, pady=(5,0), sticky="ew")
-
-            # Task Description Label
-            task_text = task.get('description', 'N/A')
-            is_done = task.get('done', False)
-            text_color = "gray" if is_done else ctk.ThemeManager.theme["CTkLabel"]["text_color"]
-            font_style = ctk.CTkFont(slant="italic" if is_done else "roman", overstrike=is_done)
-
-            task_label = ctk.CTkLabel(
-                task_frame,
-                text=task_text,
-                font=font_style,
-                text_color=text_color,
-                wraplength=300, # Wrap long text
-                justify="left",
-                anchor="w" # Align text to the west (left)
-            )
-            task_label.grid(row=0, column=1, padx=10, pady=(5, 0), sticky="ew") # Use ew sticky
-
-            # Timestamp Label
-            timestamp_str = task.get('timestamp', 'N/A')
-            timestamp_label = ctk.CTkLabel(
-                task_frame,
-                text=f"Added: {timestamp_str}",
-                font=ctk.CTkFont(size=9),
-                text_color="gray",
-                anchor="w" # Align text to the west (left)
+            os.remove(TASKS_LOG_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: could not remove '{TASKS_LOG_FILE}': {e}")
+
+    def _log_op(self, op):
+        """Appends one mutation record to the msgpack delta log.
+
+        Returns False when msgpack is unavailable or the append failed, in
+        which case the caller falls back to the debounced JSON save.
+        """
+        if msgpack is None:
+            return False
+        try:
+            if self._op_log is None:
+                self._op_log = open(TASKS_LOG_FILE, 'ab')
+            self._op_log.write(msgpack.packb(op, use_bin_type=True))
+            self._op_log.flush()
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not append to '{TASKS_LOG_FILE}': {e}")
+            return False
+
+    def _tasks_as_dicts(self):
+        """One-shot zip of the task columns back into JSON-compatible dicts."""
+        return [
+            {"id": tid, "description": desc, "done": done, "timestamp": ts}
+            for tid, desc, done, ts in zip(
+                self._task_ids, self._task_descs, self._task_dones, self._task_times
             )
-            timestamp_label.grid(row=1, column=1, padx=10, pady=(0, 5), sticky="ew") # Use ew sticky
-
+        ]
 
-            # Complete/Undo Button
-            complete_text = "Undo" if is_done else "Complete"
-            complete_fg_color = ("gray60", "gray30") if is_done else ctk.ThemeManager.theme["CTkButton"]["fg_color"]
-            complete_hover_color = ("gray70", "gray40") if is_done else ctk.ThemeManager.theme["CTkButton"]["hover_color"]
+    def refresh_task_list(self):
+        """Diffs the displayed rows against the task list.
+
+        Rebuilding every CTk widget on each mutation is expensive (geometry,
+        theme lookups, font objects), so existing rows are kept in
+        self._row_widgets and only re-gridded or reconfigured when their
+        position or done-state changed. Only rows intersecting the visible
+        viewport are materialised, so widget work is O(visible), not O(N).
+        """
+        # Display order: incomplete first, then oldest first. Sorting an
+        # index array touches only the done/timestamp columns instead of
+        # dereferencing a dict per task.
+        task_count = len(self._task_ids)
+        order = sorted(
+            range(task_count),
+            key=lambda i: (self._task_dones[i], self._task_times[i])
+        )
+
+        # Reserve a fixed height per grid row (materialised or not) so the
+        # scrollbar geometry matches the full list length.
+        for i in range(task_count):
+            self.task_list_frame.grid_rowconfigure(i, minsize=TASK_ROW_HEIGHT)
+        for i in range(task_count, self._reserved_rows):
+            self.task_list_frame.grid_rowconfigure(i, minsize=0)
+        self._reserved_rows = task_count
+
+        if not task_count:
+            for task_id in list(self._row_widgets):
+                self._row_widgets.pop(task_id)['frame'].destroy()
+            if self._no_task_label is None:
+                self._no_task_label = ctk.CTkLabel(self.task_list_frame, text="No tasks yet!", text_color="gray")
+                self._no_task_label.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+            return
+        if self._no_task_label is not None:
+            self._no_task_label.destroy()
+            self._no_task_label = None
+
+        # Materialise only the rows whose y-range intersects the viewport
+        # (plus a small buffer); a fresh canvas reports (0.0, 1.0), which
+        # keeps every row live until the list outgrows the window.
+        first_frac, last_frac = self.task_list_frame._parent_canvas.yview()
+        first_visible = max(int(first_frac * task_count) - VISIBLE_ROW_BUFFER, 0)
+        last_visible = min(int(last_frac * task_count) + VISIBLE_ROW_BUFFER, task_count - 1)
+
+        visible_ids = set()
+        for index in range(first_visible, last_visible + 1):
+            col = order[index]
+            task_id = self._task_ids[col]
+            visible_ids.add(task_id)
+            row = self._row_widgets.get(task_id)
+            if row is None:
+                self._row_widgets[task_id] = self._build_task_row(col, index)
+                continue
+            if row['grid_row'] != index:
+                row['frame'].grid_configure(row=index)
+                row['grid_row'] = index
+            if row['done'] != self._task_dones[col]:
+                self._apply_row_state(row, self._task_dones[col])
+
+        # Drop rows that scrolled out of the window or whose task is gone.
+        for task_id in list(self._row_widgets):
+            if task_id not in visible_ids:
+                self._row_widgets.pop(task_id)['frame'].destroy()
+
+    def _on_task_list_scroll(self, first, last):
+        """yscrollcommand hook: keeps the scrollbar in sync, then rebuilds
+        the row window for the new view position."""
+        self.task_list_frame._scrollbar.set(first, last)
+        self._on_viewport_change()
+
+    def _on_viewport_change(self, event=None):
+        """Schedules a row-window rebuild after a scroll or resize event."""
+        if self._viewport_job is None:
+            self._viewport_job = self.after_idle(self._refresh_viewport)
+
+    def _refresh_viewport(self):
+        self._viewport_job = None
+        self.refresh_task_list()
 
-            complete_button = ctk.CTkButton(
-                task_frame,
-                text=complete_text,
-                width=70,
-                fg_color=complete_fg_color,
-                hover_color=complete_hover_color,
-                command=lambda t=task: self.toggle_complete(t) # Pass the specific task dict
-            )
-            complete_button.grid(row=0, column=2, rowspan=2, padx=5, pady=5, sticky="e")
-
-            # Remove Button
-            remove_button = ctk.CTkButton(
-                task_frame,
-                text="Remove",
-                width=70,
-                fg_color="#D32F2F", # Red color for delete
-                hover_color="#B71C1C",
-                command=lambda t=task: self.remove_task(t) # Pass the specific task dict
-            )
-            remove_button.grid(row=0, column=3, rowspan=2, padx=(0, 5), pady=5, sticky="e")
+    def _build_task_row(self, col, index):
+        """Creates the widgets for the task in column slot `col` at grid row `index`."""
+        task_id = self._task_ids[col]
+        task_frame = self.create_gradient_frame(self.task_list_frame)
+        task_frame.grid(row=index, column=0, padx=5, pady=(5,0), sticky="ew")
+
+        # Task Description Label
+        task_label = ctk.CTkLabel(
+            task_frame,
+            text=self._task_descs[col],
+            wraplength=300, # Wrap long text
+            justify="left",
+            anchor="w" # Align text to the west (left)
+        )
+        task_label.grid(row=0, column=1, padx=10, pady=(5, 0), sticky="ew") # Use ew sticky
+
+        # Timestamp Label (epoch seconds on disk, formatted for display only)
+        timestamp_str = datetime.fromtimestamp(self._task_times[col]).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp_label = ctk.CTkLabel(
+            task_frame,
+            text=f"Added: {timestamp_str}",
+            font=self._font_timestamp,
+            text_color="gray",
+            anchor="w" # Align text to the west (left)
+        )
+        timestamp_label.grid(row=1, column=1, padx=10, pady=(0, 5), sticky="ew") # Use ew sticky
+
+        # Complete/Undo Button
+        complete_button = ctk.CTkButton(
+            task_frame,
+            width=70,
+            command=partial(self.toggle_complete, task_id)
+        )
+        complete_button.grid(row=0, column=2, rowspan=2, padx=5, pady=5, sticky="e")
+
+        # Remove Button
+        remove_button = ctk.CTkButton(
+            task_frame,
+            text="Remove",
+            width=70,
+            fg_color="#D32F2F", # Red color for delete
+            hover_color="#B71C1C",
+            command=partial(self.remove_task, task_id)
+        )
+        remove_button.grid(row=0, column=3, rowspan=2, padx=(0, 5), pady=5, sticky="e")
+
+        row = {
+            'frame': task_frame,
+            'label': task_label,
+            'complete_button': complete_button,
+            'grid_row': index,
+            'done': None,
+        }
+        self._apply_row_state(row, self._task_dones[col])
+        return row
+
+    def _apply_row_state(self, row, is_done):
+        """Restyles a cached row's label and button for its done-state."""
+        text_color = "gray" if is_done else self._default_label_color
+        font_style = self._font_done if is_done else self._font_open
+        row['label'].configure(font=font_style, text_color=text_color)
+
+        complete_fg_color = ("gray60", "gray30") if is_done else self._default_btn_fg
+        complete_hover_color = ("gray70", "gray40") if is_done else self._default_btn_hover
+        row['complete_button'].configure(
+            text="Undo" if is_done else "Complete",
+            fg_color=complete_fg_color,
+            hover_color=complete_hover_color
+        )
+        row['done'] = is_done
 
     def add_task_event(self, event=None): # event=None allows calling without keybind event
         """Adds a task from the entry field."""
         description = self.task_entry.get().strip()
         if description:
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            new_task = {
+            task_id = uuid.uuid4().hex
+            self._task_pos[task_id] = len(self._task_ids)
+            self._task_ids.append(task_id)
+            self._task_descs.append(description)
+            self._task_dones.append(False)
+            self._task_times.append(int(time.time()))
+            if not self._log_op({"op": "add", "task": {
+                "id": task_id,
                 "description": description,
                 "done": False,
-                "timestamp": now
-            }
-            self.tasks.append(new_task)
-            save_tasks(self.tasks) # Save immediately
+                "timestamp": self._task_times[-1],
+            }}):
+                self._schedule_save()
             self.task_entry.delete(0, ctk.END) # Clear entry field
             self.refresh_task_list() # Update the display
         else:
@@ -233,45 +558,47 @@ class TodoApp(ctk.CTk):
             # Consider a temporary label or disabling the add button briefly
 
 
-    def toggle_complete(self, task_to_toggle):
+    def toggle_complete(self, task_id):
         """Marks a task as done or not done."""
-        found = False
-        for i, task in enumerate(self.tasks):
-             # Using index might be slightly more reliable if descriptions/timestamps could collide,
-             # but matching dict content is generally fine if timestamps are unique enough.
-             if task['timestamp'] == task_to_toggle['timestamp'] and task['description'] == task_to_toggle['description']:
-                self.tasks[i]['done'] = not task.get('done', False)
-                found = True
-                break
-        if found:
-            save_tasks(self.tasks)
-            self.refresh_task_list()
-        else:
-             print(f"Warning: Could not find task to toggle: {task_to_toggle.get('description')}")
+        col = self._task_pos.get(task_id)
+        if col is None:
+            print(f"Warning: Could not find task to toggle: {task_id}")
+            return
+        self._task_dones[col] = not self._task_dones[col]
+        if not self._log_op({"op": "toggle", "id": task_id, "done": self._task_dones[col]}):
+            self._schedule_save()
+        self.refresh_task_list()
 
 
-    def remove_task(self, task_to_remove):
+    def remove_task(self, task_id):
         """Removes a task from the list."""
-        initial_len = len(self.tasks)
-        # Create a new list excluding the task to remove
-        # Matching both description and timestamp for better certainty
-        self.tasks = [
-            task for task in self.tasks
-            if not (task.get('timestamp') == task_to_remove.get('timestamp') and
-                    task.get('description') == task_to_remove.get('description'))
-        ]
-
-        if len(self.tasks) < initial_len: # Check if a task was actually removed
-            save_tasks(self.tasks)
-            self.refresh_task_list()
-        else:
-            print(f"Warning: Could not find task to remove: {task_to_remove.get('description')}")
+        col = self._task_pos.pop(task_id, None)
+        if col is None:
+            print(f"Warning: Could not find task to remove: {task_id}")
+            return
+        for column in (self._task_ids, self._task_descs, self._task_dones, self._task_times):
+            column.pop(col)
+        # Column slots after the removed one all shifted down by one.
+        self._task_pos = {tid: i for i, tid in enumerate(self._task_ids)}
+        if not self._log_op({"op": "del", "id": task_id}):
+            self._schedule_save()
+        self.refresh_task_list()
 
 
     def on_closing(self):
         """Saves tasks when the window is closed."""
         print("Saving tasks before closing...")
-        save_tasks(self.tasks) # Ensure tasks are saved
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+            self._save_job = None
+        # Only drop the delta log once the consolidated snapshot actually
+        # reached disk; otherwise keep it so the next start replays the
+        # session's edits over the stale snapshot.
+        if save_tasks(self._tasks_as_dicts()):
+            self._clear_op_log()
+        elif self._op_log is not None:
+            self._op_log.close()
+            self._op_log = None
         self.destroy() # Close the window
 
 # --- Run the Application ---